@@ -7,14 +7,33 @@ This package provides three renderers for Featrix Sphere Model Card JSON:
 3. React component - Dynamic React component with interactive charts
 """
 
-from .html_renderer import render_html, render_to_file as render_html_to_file
-from .text_renderer import render_brief_text, render_detailed_text, render_to_file as render_text_to_file
+from .html_renderer import (
+    CSS_FILENAME,
+    get_css,
+    iter_html,
+    render_html,
+    render_html_bytes,
+    render_html_stream,
+    render_to_file as render_html_to_file,
+)
+from .text_renderer import (
+    render_brief_text,
+    render_detailed_text,
+    render_detailed_text_stream,
+    render_to_file as render_text_to_file,
+)
 
 __all__ = [
     'render_html',
+    'render_html_bytes',
+    'render_html_stream',
+    'iter_html',
+    'get_css',
+    'CSS_FILENAME',
     'render_html_to_file',
     'render_brief_text',
     'render_detailed_text',
+    'render_detailed_text_stream',
     'render_text_to_file',
 ]
 
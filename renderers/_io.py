@@ -0,0 +1,55 @@
+"""
+File output helpers shared by the HTML and text renderers.
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Iterator, TextIO, Tuple
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+# O_BINARY keeps the Windows C runtime from translating newlines a second time
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+
+def write_text(path: str, content: str) -> str:
+    """Atomically write a fully rendered document to path and return the path."""
+    with open_atomic(path) as f:
+        f.write(content)
+    return path
+
+
+def _create_temp_sibling(path: str) -> Tuple[int, str]:
+    """Exclusively create a randomly named temporary file next to path.
+    
+    Mode 0o666 is filtered by the process umask, so the rendered file ends up
+    with the same permissions a plain open() would give it.
+    """
+    directory, name = os.path.split(path)
+    while True:
+        tmp_path = os.path.join(directory, f'.{name}.{os.urandom(6).hex()}.tmp')
+        try:
+            return os.open(tmp_path, _TMP_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+@contextmanager
+def open_atomic(path: str) -> Iterator[TextIO]:
+    """Stream into a uniquely named temporary sibling of path, then move it into place.
+    
+    Readers never see a half-written file, concurrent writers to the same path
+    never share a temporary file, and on error the temporary file is removed.
+    """
+    path = os.fspath(path)
+    fd, tmp_path = _create_temp_sibling(path)
+    try:
+        with open(fd, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
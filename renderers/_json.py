@@ -0,0 +1,11 @@
+"""
+JSON pretty-printing shared by the HTML and text renderers.
+"""
+
+import json
+from typing import Any
+
+
+def json_pretty(value: Any, indent: int = 2) -> str:
+    """Pretty-print a JSON value; NaN and Infinity are written as such, not as null."""
+    return json.dumps(value, indent=indent)
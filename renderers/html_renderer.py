@@ -7,210 +7,199 @@ Features:
 - Print-friendly CSS that prints nicely onto 1 page
 """
 
-import json
-from datetime import datetime
-from typing import Dict, Any, Optional
+import io
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from html import escape
+from typing import Dict, Any, Hashable, Iterator, List, Optional, TextIO, Tuple
 
+from ._io import open_atomic, write_text
+from ._json import json_pretty
 
-def format_value(value: Any) -> str:
-    """Format a value for display in HTML."""
+_NA_HTML = '<em>N/A</em>'
+
+
+def _text(value: Any) -> str:
+    """HTML-escape a user-supplied value for interpolation into markup."""
+    return escape(str(value))
+
+
+def _format_scalar(value: Any) -> str:
+    """Format None, a number or a string for display in HTML."""
     if value is None:
-        return '<em>N/A</em>'
+        return _NA_HTML
     if isinstance(value, float):
         return f"{value:.4f}".rstrip('0').rstrip('.')
-    if isinstance(value, bool):
-        return str(value)
+    return escape(str(value))
+
+
+def _format_json(value: Any) -> str:
+    """Pretty-print a list or dict as escaped JSON."""
+    return escape(json_pretty(value), quote=False)
+
+
+# Exact-type dispatch for format_value; subclasses fall back to isinstance checks
+_FORMATTERS = {
+    type(None): _format_scalar,
+    float: _format_scalar,
+    bool: _format_scalar,
+    int: _format_scalar,
+    str: _format_scalar,
+    list: _format_json,
+    dict: _format_json,
+}
+
+
+def format_value(value: Any) -> str:
+    """Format a value for display in HTML."""
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    if isinstance(value, (int, float, str)):
+        return _format_scalar(value)
     if isinstance(value, (list, dict)):
-        return json.dumps(value, indent=2)
-    return str(value)
+        return _format_json(value)
+    return escape(str(value))
+
+
+@lru_cache(maxsize=256, typed=True)
+def _fmt_int(n: int) -> str:
+    """Format a count with thousands separators."""
+    return format(n, ',')
 
 
 def format_percentage(value: Optional[float]) -> str:
     """Format a percentage value."""
     if value is None:
-        return '<em>N/A</em>'
-    return f"{value * 100:.2f}%"
+        return _NA_HTML
+    return f"{value * 100.0:.2f}%"
+
+
+_DEFAULT_COLOR = '#6c757d'
+_STATUS_COLORS = {'done': '#28a745', 'training': '#ffc107', 'failed': '#dc3545'}
+_QUALITY_COLORS = {'excellent': '#28a745', 'good': '#007bff', 'fair': '#ffc107', 'poor': '#fd7e14'}
+_SEVERITY_COLORS = {'high': '#dc3545', 'moderate': '#ffc107', 'low': '#007bff'}
 
 
+@lru_cache(maxsize=512)
 def get_status_color(status: str) -> str:
     """Get color for status."""
-    status_lower = status.lower()
-    if status_lower == 'done':
-        return '#28a745'
-    elif status_lower == 'training':
-        return '#ffc107'
-    elif status_lower == 'failed':
-        return '#dc3545'
-    return '#6c757d'
+    return _STATUS_COLORS.get(status.lower(), _DEFAULT_COLOR)
 
 
+@lru_cache(maxsize=512)
 def get_quality_color(assessment: Optional[str]) -> str:
     """Get color for quality assessment."""
     if not assessment:
-        return '#6c757d'
-    assessment_lower = assessment.lower()
-    if assessment_lower == 'excellent':
-        return '#28a745'
-    elif assessment_lower == 'good':
-        return '#007bff'
-    elif assessment_lower == 'fair':
-        return '#ffc107'
-    elif assessment_lower == 'poor':
-        return '#fd7e14'
-    return '#6c757d'
+        return _DEFAULT_COLOR
+    return _QUALITY_COLORS.get(assessment.lower(), _DEFAULT_COLOR)
 
 
+@lru_cache(maxsize=512)
 def get_severity_color(severity: str) -> str:
     """Get color for warning severity."""
-    severity_lower = severity.lower()
-    if severity_lower == 'high':
-        return '#dc3545'
-    elif severity_lower == 'moderate':
-        return '#ffc107'
-    elif severity_lower == 'low':
-        return '#007bff'
-    return '#6c757d'
+    return _SEVERITY_COLORS.get(severity.lower(), _DEFAULT_COLOR)
 
 
-def render_model_identification(data: Dict[str, Any]) -> str:
+def render_model_identification(data: Dict[str, Any], buf: TextIO) -> None:
     """Render model identification section."""
     mi = data.get('model_identification', {})
     
     status_color = get_status_color(mi.get('status', ''))
     
-    html = f"""
+    buf.write(f"""
     <details open>
         <summary><h2>Model Identification</h2></summary>
         <div class="section-content">
             <table class="info-table">
                 <tr>
                     <th>Session ID</th>
-                    <td><code>{mi.get('session_id', 'N/A')}</code></td>
+                    <td><code>{_text(mi.get('session_id', 'N/A'))}</code></td>
                 </tr>
                 <tr>
                     <th>Job ID</th>
-                    <td><code>{mi.get('job_id', 'N/A')}</code></td>
+                    <td><code>{_text(mi.get('job_id', 'N/A'))}</code></td>
                 </tr>
                 <tr>
                     <th>Name</th>
-                    <td><strong>{mi.get('name', 'N/A')}</strong></td>
+                    <td><strong>{_text(mi.get('name', 'N/A'))}</strong></td>
                 </tr>
                 <tr>
                     <th>Model Type</th>
-                    <td>{mi.get('model_type', 'N/A')}</td>
+                    <td>{_text(mi.get('model_type', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Status</th>
-                    <td><span class="status-badge" style="background-color: {status_color}">{mi.get('status', 'N/A')}</span></td>
+                    <td><span class="status-badge" style="background-color: {status_color}">{_text(mi.get('status', 'N/A'))}</span></td>
                 </tr>
                 <tr>
                     <th>Target Column</th>
-                    <td>{mi.get('target_column', 'N/A')}</td>
+                    <td>{_text(mi.get('target_column', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Target Type</th>
-                    <td>{mi.get('target_column_type', 'N/A')}</td>
+                    <td>{_text(mi.get('target_column_type', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Compute Cluster</th>
-                    <td>{mi.get('compute_cluster', 'N/A')}</td>
+                    <td>{_text(mi.get('compute_cluster', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Training Date</th>
-                    <td>{mi.get('training_date', 'N/A')}</td>
+                    <td>{_text(mi.get('training_date', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Framework</th>
-                    <td>{mi.get('framework', 'N/A')}</td>
+                    <td>{_text(mi.get('framework', 'N/A'))}</td>
                 </tr>
             </table>
         </div>
     </details>
-    """
-    return html
+    """)
 
 
-def render_training_dataset(data: Dict[str, Any]) -> str:
+def render_training_dataset(data: Dict[str, Any], buf: TextIO) -> None:
     """Render training dataset section."""
     td = data.get('training_dataset', {})
     
-    html = f"""
+    buf.write(f"""
     <details open>
         <summary><h2>Training Dataset</h2></summary>
         <div class="section-content">
             <div class="metrics-grid">
                 <div class="metric-card">
                     <div class="metric-label">Training Rows</div>
-                    <div class="metric-value">{td.get('train_rows', 0):,}</div>
+                    <div class="metric-value">{_fmt_int(td.get('train_rows', 0))}</div>
                 </div>
                 <div class="metric-card">
                     <div class="metric-label">Validation Rows</div>
-                    <div class="metric-value">{td.get('val_rows', 0):,}</div>
+                    <div class="metric-value">{_fmt_int(td.get('val_rows', 0))}</div>
                 </div>
                 <div class="metric-card">
                     <div class="metric-label">Total Rows</div>
-                    <div class="metric-value">{td.get('total_rows', 0):,}</div>
+                    <div class="metric-value">{_fmt_int(td.get('total_rows', 0))}</div>
                 </div>
                 <div class="metric-card">
                     <div class="metric-label">Total Features</div>
-                    <div class="metric-value">{td.get('total_features', 0)}</div>
+                    <div class="metric-value">{_text(td.get('total_features', 0))}</div>
                 </div>
             </div>
             <div class="feature-names">
                 <h3>Feature Names</h3>
                 <div class="tag-list">
-                    {''.join([f'<span class="tag">{name}</span>' for name in td.get('feature_names', [])])}
+                    {''.join([f'<span class="tag">{_text(name)}</span>' for name in td.get('feature_names', ())])}
                 </div>
             </div>
         </div>
     </details>
-    """
-    return html
+    """)
 
 
-def render_feature_inventory(data: Dict[str, Any]) -> str:
-    """Render feature inventory section."""
-    features = data.get('feature_inventory', [])
-    
-    rows = []
-    for feat in features:
-        name = feat.get('name', 'N/A')
-        feat_type = feat.get('type', 'N/A')
-        encoder = feat.get('encoder_type', 'N/A')
-        unique_vals = feat.get('unique_values')
-        sample_vals = feat.get('sample_values', [])
-        stats = feat.get('statistics')
-        
-        stats_html = '<em>N/A</em>'
-        if stats:
-            stats_html = f"""
-            <div class="stats-grid">
-                <div>Min: {format_value(stats.get('min'))}</div>
-                <div>Max: {format_value(stats.get('max'))}</div>
-                <div>Mean: {format_value(stats.get('mean'))}</div>
-                <div>Std: {format_value(stats.get('std'))}</div>
-                <div>Median: {format_value(stats.get('median'))}</div>
-            </div>
-            """
-        
-        sample_html = '<em>N/A</em>'
-        if sample_vals:
-            sample_html = ', '.join([str(v) for v in sample_vals[:5]])
-            if len(sample_vals) > 5:
-                sample_html += f' <em>(+{len(sample_vals) - 5} more)</em>'
-        
-        rows.append(f"""
-        <tr>
-            <td><strong>{name}</strong></td>
-            <td>{feat_type}</td>
-            <td>{encoder}</td>
-            <td>{unique_vals if unique_vals is not None else '<em>N/A</em>'}</td>
-            <td>{sample_html}</td>
-            <td>{stats_html}</td>
-        </tr>
-        """)
-    
-    html = f"""
+_FEATURE_INVENTORY_HEAD = """
     <details>
         <summary><h2>Feature Inventory</h2></summary>
         <div class="section-content">
@@ -226,40 +215,85 @@ def render_feature_inventory(data: Dict[str, Any]) -> str:
                     </tr>
                 </thead>
                 <tbody>
-                    {''.join(rows)}
+    """
+
+_FEATURE_INVENTORY_TAIL = """
                 </tbody>
             </table>
         </div>
     </details>
     """
-    return html
 
 
-def render_training_configuration(data: Dict[str, Any]) -> str:
+def _render_feature_row(feat: Dict[str, Any]) -> str:
+    """Render one feature inventory table row."""
+    unique_vals = feat.get('unique_values')
+    
+    stats = feat.get('statistics')
+    stats_html = _NA_HTML
+    if stats:
+        stats_html = f"""
+            <div class="stats-grid">
+                <div>Min: {format_value(stats.get('min'))}</div>
+                <div>Max: {format_value(stats.get('max'))}</div>
+                <div>Mean: {format_value(stats.get('mean'))}</div>
+                <div>Std: {format_value(stats.get('std'))}</div>
+                <div>Median: {format_value(stats.get('median'))}</div>
+            </div>
+            """
+    
+    sample_vals = feat.get('sample_values') or ()
+    sample_html = _NA_HTML
+    if sample_vals:
+        sample_html = ', '.join(map(_text, sample_vals[:5]))
+        if len(sample_vals) > 5:
+            sample_html += f' <em>(+{len(sample_vals) - 5} more)</em>'
+    
+    return f"""
+        <tr>
+            <td><strong>{_text(feat.get('name', 'N/A'))}</strong></td>
+            <td>{_text(feat.get('type', 'N/A'))}</td>
+            <td>{_text(feat.get('encoder_type', 'N/A'))}</td>
+            <td>{_text(unique_vals) if unique_vals is not None else _NA_HTML}</td>
+            <td>{sample_html}</td>
+            <td>{stats_html}</td>
+        </tr>
+        """
+
+
+def render_feature_inventory(data: Dict[str, Any], buf: TextIO) -> None:
+    """Render feature inventory section."""
+    features = data.get('feature_inventory', [])
+    buf.write(_FEATURE_INVENTORY_HEAD)
+    buf.writelines(map(_render_feature_row, features))
+    buf.write(_FEATURE_INVENTORY_TAIL)
+
+
+def render_training_configuration(data: Dict[str, Any], buf: TextIO) -> None:
     """Render training configuration section."""
     tc = data.get('training_configuration', {})
     dropout = tc.get('dropout_schedule')
     
-    html = f"""
+    buf.write(f"""
     <details>
         <summary><h2>Training Configuration</h2></summary>
         <div class="section-content">
             <table class="info-table">
                 <tr>
                     <th>Total Epochs</th>
-                    <td>{tc.get('epochs_total', 'N/A')}</td>
+                    <td>{_text(tc.get('epochs_total', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Best Epoch</th>
-                    <td>{tc.get('best_epoch', 'N/A')}</td>
+                    <td>{_text(tc.get('best_epoch', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>d_model</th>
-                    <td>{tc.get('d_model', 'N/A')}</td>
+                    <td>{_text(tc.get('d_model', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Batch Size</th>
-                    <td>{tc.get('batch_size', 'N/A')}</td>
+                    <td>{_text(tc.get('batch_size', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Learning Rate</th>
@@ -267,85 +301,41 @@ def render_training_configuration(data: Dict[str, Any]) -> str:
                 </tr>
                 <tr>
                     <th>Optimizer</th>
-                    <td>{tc.get('optimizer', 'N/A')}</td>
+                    <td>{_text(tc.get('optimizer', 'N/A'))}</td>
                 </tr>
-    """
+    """)
     
     if dropout:
-        html += f"""
+        buf.write(f"""
                 <tr>
                     <th>Dropout Schedule</th>
                     <td>
-                        <div>Enabled: {dropout.get('enabled', False)}</div>
+                        <div>Enabled: {_text(dropout.get('enabled', False))}</div>
                         <div>Initial: {format_value(dropout.get('initial'))}</div>
                         <div>Final: {format_value(dropout.get('final'))}</div>
                     </td>
                 </tr>
-        """
+        """)
     
-    html += """
+    buf.write("""
             </table>
         </div>
     </details>
-    """
-    return html
+    """)
 
 
-def render_training_metrics(data: Dict[str, Any]) -> str:
-    """Render training metrics section."""
-    tm = data.get('training_metrics', {})
-    model_type = data.get('model_identification', {}).get('model_type', '')
-    
-    html = f"""
+_TRAINING_METRICS_HEAD = """
     <details open>
         <summary><h2>Training Metrics</h2></summary>
         <div class="section-content">
     """
-    
-    # Best epoch
-    best_epoch = tm.get('best_epoch', {})
-    html += f"""
-            <h3>Best Epoch</h3>
-            <table class="info-table">
-                <tr>
-                    <th>Epoch</th>
-                    <td>{best_epoch.get('epoch', 'N/A')}</td>
-                </tr>
-                <tr>
-                    <th>Validation Loss</th>
-                    <td>{format_value(best_epoch.get('validation_loss'))}</td>
-                </tr>
-                <tr>
-                    <th>Train Loss</th>
-                    <td>{format_value(best_epoch.get('train_loss'))}</td>
-                </tr>
-    """
-    
-    if best_epoch.get('spread_loss') is not None:
-        html += f"""
-                <tr>
-                    <th>Spread Loss</th>
-                    <td>{format_value(best_epoch.get('spread_loss'))}</td>
-                </tr>
-                <tr>
-                    <th>Joint Loss</th>
-                    <td>{format_value(best_epoch.get('joint_loss'))}</td>
-                </tr>
-                <tr>
-                    <th>Marginal Loss</th>
-                    <td>{format_value(best_epoch.get('marginal_loss'))}</td>
-                </tr>
-        """
-    
-    html += """
-            </table>
-    """
-    
-    # Classification metrics (Single Predictor)
-    if model_type == 'Single Predictor':
-        cm = tm.get('classification_metrics')
-        if cm:
-            html += f"""
+
+
+def _render_single_predictor_metrics(tm: Dict[str, Any], buf: TextIO) -> None:
+    """Render the Single Predictor specific training metrics."""
+    cm = tm.get('classification_metrics')
+    if cm:
+        buf.write(f"""
             <h3>Classification Metrics</h3>
             <div class="metrics-grid">
                 <div class="metric-card">
@@ -370,15 +360,15 @@ def render_training_metrics(data: Dict[str, Any]) -> str:
                 </div>
                 <div class="metric-card">
                     <div class="metric-label">Binary Classification</div>
-                    <div class="metric-value">{cm.get('is_binary', False)}</div>
+                    <div class="metric-value">{_text(cm.get('is_binary', False))}</div>
                 </div>
             </div>
-            """
-        
-        # Optimal threshold
-        opt_thresh = tm.get('optimal_threshold')
-        if opt_thresh:
-            html += f"""
+            """)
+    
+    # Optimal threshold
+    opt_thresh = tm.get('optimal_threshold')
+    if opt_thresh:
+        buf.write(f"""
             <h3>Optimal Threshold</h3>
             <table class="info-table">
                 <tr>
@@ -387,7 +377,7 @@ def render_training_metrics(data: Dict[str, Any]) -> str:
                 </tr>
                 <tr>
                     <th>Positive Label</th>
-                    <td>{opt_thresh.get('pos_label', 'N/A')}</td>
+                    <td>{_text(opt_thresh.get('pos_label', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>F1 at Optimal Threshold</th>
@@ -398,12 +388,12 @@ def render_training_metrics(data: Dict[str, Any]) -> str:
                     <td>{format_percentage(opt_thresh.get('accuracy_at_optimal_threshold'))}</td>
                 </tr>
             </table>
-            """
-        
-        # Argmax metrics
-        argmax = tm.get('argmax_metrics')
-        if argmax:
-            html += f"""
+            """)
+    
+    # Argmax metrics
+    argmax = tm.get('argmax_metrics')
+    if argmax:
+        buf.write(f"""
             <h3>Argmax Metrics</h3>
             <div class="metrics-grid">
                 <div class="metric-card">
@@ -423,13 +413,14 @@ def render_training_metrics(data: Dict[str, Any]) -> str:
                     <div class="metric-value">{format_percentage(argmax.get('f1'))}</div>
                 </div>
             </div>
-            """
-    
-    # Loss progression (Embedding Space)
-    if model_type == 'Embedding Space':
-        loss_prog = tm.get('loss_progression')
-        if loss_prog:
-            html += f"""
+            """)
+
+
+def _render_embedding_space_metrics(tm: Dict[str, Any], buf: TextIO) -> None:
+    """Render the Embedding Space specific training metrics."""
+    loss_prog = tm.get('loss_progression')
+    if loss_prog:
+        buf.write(f"""
             <h3>Loss Progression</h3>
             <table class="info-table">
                 <tr>
@@ -445,16 +436,16 @@ def render_training_metrics(data: Dict[str, Any]) -> str:
                     <td>{format_value(loss_prog.get('improvement_pct'))}</td>
                 </tr>
             </table>
-            """
-        
-        final_epoch = tm.get('final_epoch')
-        if final_epoch:
-            html += f"""
+            """)
+    
+    final_epoch = tm.get('final_epoch')
+    if final_epoch:
+        buf.write(f"""
             <h3>Final Epoch</h3>
             <table class="info-table">
                 <tr>
                     <th>Epoch</th>
-                    <td>{final_epoch.get('epoch', 'N/A')}</td>
+                    <td>{_text(final_epoch.get('epoch', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Train Loss</th>
@@ -465,253 +456,313 @@ def render_training_metrics(data: Dict[str, Any]) -> str:
                     <td>{format_value(final_epoch.get('val_loss'))}</td>
                 </tr>
             </table>
-            """
+            """)
+
+
+_METRIC_RENDERERS = {
+    'Single Predictor': _render_single_predictor_metrics,
+    'Embedding Space': _render_embedding_space_metrics,
+}
+
+
+def render_training_metrics(data: Dict[str, Any], buf: TextIO) -> None:
+    """Render training metrics section."""
+    tm = data.get('training_metrics', {})
+    model_type = data.get('model_identification', {}).get('model_type', '')
+    
+    buf.write(_TRAINING_METRICS_HEAD)
     
-    html += """
+    # Best epoch
+    best_epoch = tm.get('best_epoch', {})
+    buf.write(f"""
+            <h3>Best Epoch</h3>
+            <table class="info-table">
+                <tr>
+                    <th>Epoch</th>
+                    <td>{_text(best_epoch.get('epoch', 'N/A'))}</td>
+                </tr>
+                <tr>
+                    <th>Validation Loss</th>
+                    <td>{format_value(best_epoch.get('validation_loss'))}</td>
+                </tr>
+                <tr>
+                    <th>Train Loss</th>
+                    <td>{format_value(best_epoch.get('train_loss'))}</td>
+                </tr>
+    """)
+    
+    if best_epoch.get('spread_loss') is not None:
+        buf.write(f"""
+                <tr>
+                    <th>Spread Loss</th>
+                    <td>{format_value(best_epoch.get('spread_loss'))}</td>
+                </tr>
+                <tr>
+                    <th>Joint Loss</th>
+                    <td>{format_value(best_epoch.get('joint_loss'))}</td>
+                </tr>
+                <tr>
+                    <th>Marginal Loss</th>
+                    <td>{format_value(best_epoch.get('marginal_loss'))}</td>
+                </tr>
+        """)
+    
+    buf.write("""
+            </table>
+    """)
+    
+    render_model_metrics = _METRIC_RENDERERS.get(model_type)
+    if render_model_metrics is not None:
+        render_model_metrics(tm, buf)
+    
+    buf.write("""
         </div>
     </details>
-    """
-    return html
+    """)
 
 
-def render_model_architecture(data: Dict[str, Any]) -> str:
-    """Render model architecture section."""
-    ma = data.get('model_architecture', {})
-    
-    html = f"""
+_MODEL_ARCH_HEAD = """
     <details>
         <summary><h2>Model Architecture</h2></summary>
         <div class="section-content">
             <table class="info-table">
     """
+
+_MODEL_ARCH_KEYS = ('predictor_layers', 'predictor_parameters', 'embedding_space_d_model')
+
+
+def render_model_architecture(data: Dict[str, Any], buf: TextIO) -> None:
+    """Render model architecture section."""
+    ma = data.get('model_architecture', {})
+    
+    if all(ma.get(k) is None for k in _MODEL_ARCH_KEYS):
+        return
+    
+    buf.write(_MODEL_ARCH_HEAD)
     
     if ma.get('predictor_layers') is not None:
-        html += f"""
+        buf.write(f"""
                 <tr>
                     <th>Predictor Layers</th>
-                    <td>{ma.get('predictor_layers')}</td>
+                    <td>{_text(ma.get('predictor_layers'))}</td>
                 </tr>
-        """
+        """)
     
     if ma.get('predictor_parameters') is not None:
-        html += f"""
+        buf.write(f"""
                 <tr>
                     <th>Predictor Parameters</th>
-                    <td>{ma.get('predictor_parameters'):,}</td>
+                    <td>{_fmt_int(ma.get('predictor_parameters'))}</td>
                 </tr>
-        """
+        """)
     
     if ma.get('embedding_space_d_model') is not None:
-        html += f"""
+        buf.write(f"""
                 <tr>
                     <th>Embedding Space d_model</th>
-                    <td>{ma.get('embedding_space_d_model')}</td>
+                    <td>{_text(ma.get('embedding_space_d_model'))}</td>
                 </tr>
-        """
+        """)
     
-    html += """
+    buf.write("""
             </table>
         </div>
     </details>
-    """
-    return html
+    """)
 
 
-def render_model_quality(data: Dict[str, Any]) -> str:
-    """Render model quality section."""
-    mq = data.get('model_quality', {})
-    
-    html = f"""
+_MODEL_QUALITY_HEAD = """
     <details open>
         <summary><h2>Model Quality</h2></summary>
         <div class="section-content">
     """
+
+_MODEL_QUALITY_KEYS = ('assessment', 'recommendations', 'warnings', 'training_quality_warning')
+
+_WARNING_TAIL = """
+                </div>
+            """
+
+
+def _render_warning(warning: Dict[str, Any]) -> str:
+    """Render one model quality warning."""
+    severity = warning.get('severity', 'UNKNOWN')
+    parts = [f"""
+                <div class="warning-item">
+                    <div class="warning-header">
+                        <span class="severity-badge" style="background-color: {get_severity_color(severity)}">{_text(severity)}</span>
+                        <strong>{_text(warning.get('type', 'N/A'))}</strong>
+                    </div>
+                    <div class="warning-message">{_text(warning.get('message', 'N/A'))}</div>
+            """]
+    if warning.get('recommendation'):
+        parts.append(f"""
+                    <div class="warning-recommendation">
+                        <strong>Recommendation:</strong> {_text(warning['recommendation'])}
+                    </div>
+                """)
+    details = warning.get('details')
+    if details:
+        parts.append(f"""
+                    <details class="warning-details">
+                        <summary>Details</summary>
+                        <pre class="details-json">{escape(json_pretty(details), quote=False)}</pre>
+                    </details>
+                """)
+    parts.append(_WARNING_TAIL)
+    return ''.join(parts)
+
+
+def render_model_quality(data: Dict[str, Any], buf: TextIO) -> None:
+    """Render model quality section."""
+    mq = data.get('model_quality', {})
+    
+    if not any(mq.get(k) for k in _MODEL_QUALITY_KEYS):
+        return
+    
+    buf.write(_MODEL_QUALITY_HEAD)
     
     assessment = mq.get('assessment')
     if assessment:
         quality_color = get_quality_color(assessment)
-        html += f"""
+        buf.write(f"""
             <div class="quality-assessment">
                 <h3>Assessment</h3>
-                <span class="quality-badge" style="background-color: {quality_color}">{assessment}</span>
+                <span class="quality-badge" style="background-color: {quality_color}">{_text(assessment)}</span>
             </div>
-        """
+        """)
     
     recommendations = mq.get('recommendations', [])
     if recommendations:
-        html += """
+        buf.write("""
             <h3>Recommendations</h3>
             <ul class="recommendations-list">
-        """
+        """)
         for rec in recommendations:
-            html += f"""
+            buf.write(f"""
                 <li>
-                    <strong>Issue:</strong> {rec.get('issue', 'N/A')}<br>
-                    <strong>Suggestion:</strong> {rec.get('suggestion', 'N/A')}
+                    <strong>Issue:</strong> {_text(rec.get('issue', 'N/A'))}<br>
+                    <strong>Suggestion:</strong> {_text(rec.get('suggestion', 'N/A'))}
                 </li>
-            """
-        html += """
+            """)
+        buf.write("""
             </ul>
-        """
+        """)
     
     warnings = mq.get('warnings', [])
     if warnings:
-        html += """
+        buf.write("""
             <h3>Warnings</h3>
             <div class="warnings-list">
-        """
-        for warning in warnings:
-            severity = warning.get('severity', 'UNKNOWN')
-            severity_color = get_severity_color(severity)
-            html += f"""
-                <div class="warning-item">
-                    <div class="warning-header">
-                        <span class="severity-badge" style="background-color: {severity_color}">{severity}</span>
-                        <strong>{warning.get('type', 'N/A')}</strong>
-                    </div>
-                    <div class="warning-message">{warning.get('message', 'N/A')}</div>
-            """
-            if warning.get('recommendation'):
-                html += f"""
-                    <div class="warning-recommendation">
-                        <strong>Recommendation:</strong> {warning.get('recommendation')}
-                    </div>
-                """
-            details = warning.get('details')
-            if details:
-                html += """
-                    <details class="warning-details">
-                        <summary>Details</summary>
-                        <pre class="details-json">""" + json.dumps(details, indent=2) + """</pre>
-                    </details>
-                """
-            html += """
-                </div>
-            """
-        html += """
+        """)
+        buf.writelines(map(_render_warning, warnings))
+        buf.write("""
             </div>
-        """
+        """)
     
     training_quality_warning = mq.get('training_quality_warning')
     if training_quality_warning:
-        html += f"""
+        buf.write(f"""
             <div class="training-quality-warning">
                 <h3>Training Quality Warning</h3>
-                <p>{training_quality_warning}</p>
+                <p>{_text(training_quality_warning)}</p>
             </div>
-        """
+        """)
     
-    html += """
+    buf.write("""
         </div>
     </details>
-    """
-    return html
+    """)
 
 
-def render_technical_details(data: Dict[str, Any]) -> str:
+def render_technical_details(data: Dict[str, Any], buf: TextIO) -> None:
     """Render technical details section."""
     td = data.get('technical_details', {})
     
-    html = f"""
+    if not td:
+        return
+    
+    buf.write(f"""
     <details>
         <summary><h2>Technical Details</h2></summary>
         <div class="section-content">
             <table class="info-table">
                 <tr>
                     <th>PyTorch Version</th>
-                    <td>{td.get('pytorch_version', 'N/A')}</td>
+                    <td>{_text(td.get('pytorch_version', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Device</th>
-                    <td>{td.get('device', 'N/A')}</td>
+                    <td>{_text(td.get('device', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Precision</th>
-                    <td>{td.get('precision', 'N/A')}</td>
+                    <td>{_text(td.get('precision', 'N/A'))}</td>
                 </tr>
                 <tr>
                     <th>Loss Function</th>
-                    <td>{td.get('loss_function', 'N/A')}</td>
+                    <td>{_text(td.get('loss_function', 'N/A'))}</td>
                 </tr>
-    """
+    """)
     
     if td.get('normalization'):
-        html += f"""
+        buf.write(f"""
                 <tr>
                     <th>Normalization</th>
-                    <td>{td.get('normalization')}</td>
+                    <td>{_text(td.get('normalization'))}</td>
                 </tr>
-        """
+        """)
     
-    html += """
+    buf.write("""
             </table>
         </div>
     </details>
-    """
-    return html
+    """)
 
 
-def render_provenance(data: Dict[str, Any]) -> str:
+def render_provenance(data: Dict[str, Any], buf: TextIO) -> None:
     """Render provenance section."""
     prov = data.get('provenance', {})
     
-    html = f"""
+    buf.write(f"""
     <details>
         <summary><h2>Provenance</h2></summary>
         <div class="section-content">
             <table class="info-table">
                 <tr>
                     <th>Created At</th>
-                    <td>{prov.get('created_at', 'N/A')}</td>
+                    <td>{_text(prov.get('created_at', 'N/A'))}</td>
                 </tr>
-    """
+    """)
     
     if prov.get('training_duration_minutes') is not None:
         duration = prov.get('training_duration_minutes')
         hours = int(duration // 60)
         minutes = int(duration % 60)
-        html += f"""
+        buf.write(f"""
                 <tr>
                     <th>Training Duration</th>
                     <td>{hours}h {minutes}m ({duration:.2f} minutes)</td>
                 </tr>
-        """
+        """)
     
     version_info = prov.get('version_info')
     if version_info:
-        html += f"""
+        buf.write(f"""
                 <tr>
                     <th>Version Info</th>
-                    <td><pre class="details-json">{json.dumps(version_info, indent=2)}</pre></td>
+                    <td><pre class="details-json">{escape(json_pretty(version_info), quote=False)}</pre></td>
                 </tr>
-        """
+        """)
     
-    html += """
+    buf.write("""
             </table>
         </div>
     </details>
-    """
-    return html
+    """)
 
 
-def render_column_statistics(data: Dict[str, Any]) -> str:
-    """Render column statistics section (Embedding Space only)."""
-    cs = data.get('column_statistics', {})
-    
-    if not cs:
-        return ""
-    
-    rows = []
-    for col_name, stats in cs.items():
-        rows.append(f"""
-        <tr>
-            <td><strong>{col_name}</strong></td>
-            <td>{format_value(stats.get('mutual_information_bits'))}</td>
-            <td>{format_value(stats.get('marginal_loss'))}</td>
-        </tr>
-        """)
-    
-    html = f"""
+_COLUMN_STATS_HEAD = """
     <details>
         <summary><h2>Column Statistics</h2></summary>
         <div class="section-content">
@@ -724,81 +775,92 @@ def render_column_statistics(data: Dict[str, Any]) -> str:
                     </tr>
                 </thead>
                 <tbody>
-                    {''.join(rows)}
+    """
+
+_COLUMN_STATS_TAIL = """
                 </tbody>
             </table>
         </div>
     </details>
     """
-    return html
 
 
-def render_html(model_card_json: Dict[str, Any]) -> str:
-    """Render complete HTML model card."""
-    
-    # Render all sections
-    sections = [
-        render_model_identification(model_card_json),
-        render_training_dataset(model_card_json),
-        render_feature_inventory(model_card_json),
-        render_training_configuration(model_card_json),
-        render_training_metrics(model_card_json),
-        render_model_architecture(model_card_json),
-        render_model_quality(model_card_json),
-        render_technical_details(model_card_json),
-        render_provenance(model_card_json),
-        render_column_statistics(model_card_json),
-    ]
+def render_column_statistics(data: Dict[str, Any], buf: TextIO) -> None:
+    """Render column statistics section (Embedding Space only)."""
+    cs = data.get('column_statistics', {})
     
-    model_name = model_card_json.get('model_identification', {}).get('name', 'Model Card')
+    if not cs:
+        return
     
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Model Card - {model_name}</title>
-    <style>
-        * {{
+    buf.write(_COLUMN_STATS_HEAD)
+    buf.writelines(
+        f"""
+        <tr>
+            <td><strong>{_text(col_name)}</strong></td>
+            <td>{format_value(stats.get('mutual_information_bits'))}</td>
+            <td>{format_value(stats.get('marginal_loss'))}</td>
+        </tr>
+        """
+        for col_name, stats in cs.items()
+    )
+    buf.write(_COLUMN_STATS_TAIL)
+
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};,>])\s*')
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_SPACE_RE.sub(' ', css)
+    css = _CSS_PUNCT_RE.sub(r'\1', css)
+    css = css.replace(': ', ':').replace(';}', '}')
+    return css.strip()
+
+
+_CSS = _minify_css("""
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             line-height: 1.6;
             color: #333;
             background: #f5f5f5;
             padding: 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             padding: 40px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .header {{
+        .header {
             border-bottom: 3px solid #667eea;
             padding-bottom: 20px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 32px;
             color: #333;
             margin-bottom: 10px;
-        }}
+        }
         
-        .header .meta {{
+        .header .meta {
             color: #666;
             font-size: 14px;
-        }}
+        }
         
-        .controls {{
+        .controls {
             margin-bottom: 20px;
             padding: 15px;
             background: #f8f9fa;
@@ -806,9 +868,9 @@ def render_html(model_card_json: Dict[str, Any]) -> str:
             display: flex;
             gap: 10px;
             flex-wrap: wrap;
-        }}
+        }
         
-        .btn {{
+        .btn {
             padding: 8px 16px;
             background: #667eea;
             color: white;
@@ -816,354 +878,531 @@ def render_html(model_card_json: Dict[str, Any]) -> str:
             border-radius: 4px;
             cursor: pointer;
             font-size: 14px;
-        }}
+        }
         
-        .btn:hover {{
+        .btn:hover {
             background: #5568d3;
-        }}
+        }
         
-        .btn-secondary {{
+        .btn-secondary {
             background: #6c757d;
-        }}
+        }
         
-        .btn-secondary:hover {{
+        .btn-secondary:hover {
             background: #5a6268;
-        }}
+        }
         
-        details {{
+        details {
             margin-bottom: 20px;
             border: 1px solid #ddd;
             border-radius: 5px;
             background: white;
-        }}
+        }
         
-        details summary {{
+        details summary {
             padding: 15px 20px;
             cursor: pointer;
             font-weight: 600;
             background: #f8f9fa;
             border-radius: 5px 5px 0 0;
             user-select: none;
-        }}
+        }
         
-        details summary:hover {{
+        details summary:hover {
             background: #e9ecef;
-        }}
+        }
         
-        details summary::-webkit-details-marker {{
+        details summary::-webkit-details-marker {
             display: none;
-        }}
+        }
         
-        details summary::before {{
+        details summary::before {
             content: '▶';
             display: inline-block;
             margin-right: 10px;
             transition: transform 0.2s;
-        }}
+        }
         
-        details[open] summary::before {{
+        details[open] summary::before {
             transform: rotate(90deg);
-        }}
+        }
         
-        details summary h2 {{
+        details summary h2 {
             display: inline;
             font-size: 20px;
             margin: 0;
-        }}
+        }
         
-        .section-content {{
+        .section-content {
             padding: 20px;
-        }}
+        }
         
-        .metrics-grid {{
+        .metrics-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             margin: 20px 0;
-        }}
+        }
         
-        .metric-card {{
+        .metric-card {
             background: #f8f9fa;
             padding: 15px;
             border-radius: 5px;
             border-left: 4px solid #667eea;
-        }}
+        }
         
-        .metric-label {{
+        .metric-label {
             font-size: 12px;
             color: #666;
             text-transform: uppercase;
             letter-spacing: 0.5px;
             margin-bottom: 5px;
-        }}
+        }
         
-        .metric-value {{
+        .metric-value {
             font-size: 24px;
             font-weight: bold;
             color: #333;
-        }}
+        }
         
-        .info-table {{
+        .info-table, .data-table {
             width: 100%;
             border-collapse: collapse;
             margin: 15px 0;
-        }}
+        }
         
-        .info-table th {{
-            text-align: left;
+        .info-table th, .info-table td {
             padding: 10px;
+            border-bottom: 1px solid #ddd;
+        }
+        
+        .info-table th {
+            text-align: left;
             background: #f8f9fa;
             font-weight: 600;
             width: 200px;
-            border-bottom: 1px solid #ddd;
-        }}
+        }
         
-        .info-table td {{
-            padding: 10px;
-            border-bottom: 1px solid #ddd;
-        }}
-        
-        .data-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 15px 0;
+        .data-table {
             font-size: 14px;
-        }}
+        }
         
-        .data-table th {{
+        .data-table th {
             background: #667eea;
             color: white;
             padding: 12px;
             text-align: left;
             font-weight: 600;
-        }}
+        }
         
-        .data-table td {{
+        .data-table td {
             padding: 10px 12px;
             border-bottom: 1px solid #ddd;
-        }}
+        }
         
-        .data-table tr:hover {{
+        .data-table tr:hover {
             background: #f8f9fa;
-        }}
+        }
         
-        .tag-list {{
+        .tag-list {
             display: flex;
             flex-wrap: wrap;
             gap: 8px;
             margin-top: 10px;
-        }}
+        }
         
-        .tag {{
+        .tag, .status-badge, .quality-badge, .severity-badge {
             display: inline-block;
             padding: 4px 12px;
-            background: #e3f2fd;
-            color: #1976d2;
             border-radius: 12px;
             font-size: 12px;
-        }}
+        }
         
-        .status-badge, .quality-badge, .severity-badge {{
-            display: inline-block;
-            padding: 4px 12px;
+        .tag {
+            background: #e3f2fd;
+            color: #1976d2;
+        }
+        
+        .status-badge, .quality-badge, .severity-badge {
             color: white;
-            border-radius: 12px;
-            font-size: 12px;
             font-weight: 600;
-        }}
+        }
         
-        .quality-assessment {{
+        .quality-assessment {
             margin: 20px 0;
-        }}
+        }
         
-        .recommendations-list {{
-            list-style: none;
+        .recommendations-list, .warnings-list {
             margin: 15px 0;
-        }}
+        }
+        
+        .recommendations-list {
+            list-style: none;
+        }
         
-        .recommendations-list li {{
+        .recommendations-list li {
             padding: 15px;
             margin-bottom: 10px;
             background: #f8f9fa;
             border-left: 4px solid #667eea;
             border-radius: 4px;
-        }}
-        
-        .warnings-list {{
-            margin: 15px 0;
-        }}
+        }
         
-        .warning-item {{
+        .warning-item, .training-quality-warning {
             padding: 15px;
-            margin-bottom: 15px;
             background: #fff3cd;
             border-left: 4px solid #ffc107;
             border-radius: 4px;
-        }}
+        }
+        
+        .warning-item {
+            margin-bottom: 15px;
+        }
         
-        .warning-header {{
+        .warning-header {
             display: flex;
             align-items: center;
             gap: 10px;
             margin-bottom: 10px;
-        }}
+        }
         
-        .warning-message {{
+        .warning-message {
             margin: 10px 0;
-        }}
+        }
         
-        .warning-recommendation {{
+        .warning-recommendation {
             margin-top: 10px;
             padding: 10px;
             background: white;
             border-radius: 4px;
-        }}
+        }
         
-        .warning-details {{
+        .warning-details {
             margin-top: 10px;
-        }}
+        }
         
-        .warning-details summary {{
+        .warning-details summary {
             padding: 5px;
             font-size: 14px;
             background: transparent;
-        }}
+        }
         
-        .details-json {{
+        .details-json {
             background: #f8f9fa;
             padding: 15px;
             border-radius: 4px;
             overflow-x: auto;
             font-size: 12px;
             margin-top: 10px;
-        }}
+        }
         
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(2, 1fr);
             gap: 5px;
             font-size: 12px;
-        }}
+        }
         
-        .training-quality-warning {{
-            padding: 15px;
-            background: #fff3cd;
-            border-left: 4px solid #ffc107;
-            border-radius: 4px;
+        .training-quality-warning {
             margin: 15px 0;
-        }}
+        }
         
-        code {{
+        code {
             background: #f8f9fa;
             padding: 2px 6px;
             border-radius: 3px;
             font-family: 'Courier New', monospace;
             font-size: 13px;
-        }}
+        }
         
         /* Print Styles */
-        @media print {{
-            @page {{
+        @media print {
+            @page {
                 size: letter;
                 margin: 0.5in;
-            }}
+            }
             
-            body {{
+            body {
                 background: white;
                 padding: 0;
-            }}
+            }
             
-            .container {{
+            .container {
                 box-shadow: none;
                 padding: 0;
-            }}
+            }
             
-            .controls {{
+            .controls {
                 display: none;
-            }}
+            }
             
-            details {{
+            details {
                 page-break-inside: avoid;
                 border: none;
-            }}
+            }
             
-            details summary {{
+            details summary {
                 page-break-after: avoid;
-            }}
+            }
             
-            details[open] {{
+            details[open] {
                 display: block;
-            }}
+            }
             
-            details:not([open]) {{
+            details:not([open]) {
                 display: none;
-            }}
+            }
             
-            .section-content {{
+            .section-content {
                 padding: 10px 0;
-            }}
+            }
             
-            .metrics-grid {{
+            .metrics-grid {
                 grid-template-columns: repeat(2, 1fr);
-            }}
+            }
             
-            .data-table {{
+            .data-table {
                 font-size: 10pt;
-            }}
+            }
             
             .data-table th,
-            .data-table td {{
+            .data-table td {
                 padding: 6px;
-            }}
+            }
             
             .warning-item,
-            .recommendations-list li {{
+            .recommendations-list li {
                 page-break-inside: avoid;
-            }}
-        }}
-    </style>
-</head>
+            }
+        }
+""")
+
+_HTML_PREFIX = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Model Card - """
+
+# Stylesheet written next to HTML files rendered with inline_css=False
+CSS_FILENAME = 'model_card.css'
+
+_HTML_BODY_OPEN = """</head>
 <body>
     <div class="container">
-        <div class="header">
-            <h1>Model Card: {model_name}</h1>
-            <div class="meta">
-                Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-            </div>
-        </div>
-        
+"""
+
+_HTML_MID = """</title>
+    <style>""" + _CSS + """</style>
+""" + _HTML_BODY_OPEN
+
+_HTML_MID_LINKED = f"""</title>
+    <link rel="stylesheet" href="{CSS_FILENAME}">
+""" + _HTML_BODY_OPEN
+
+_HTML_CONTROLS = """
         <div class="controls">
             <button class="btn" onclick="expandAll()">Expand All</button>
             <button class="btn btn-secondary" onclick="collapseAll()">Collapse All</button>
         </div>
-        
-        {''.join(sections)}
+"""
+
+_HTML_SUFFIX = """
     </div>
     
     <script>
-        function expandAll() {{
-            document.querySelectorAll('details').forEach(detail => {{
+        function expandAll() {
+            document.querySelectorAll('details').forEach(detail => {
                 detail.open = true;
-            }});
-        }}
+            });
+        }
         
-        function collapseAll() {{
-            document.querySelectorAll('details').forEach(detail => {{
+        function collapseAll() {
+            document.querySelectorAll('details').forEach(detail => {
                 detail.open = false;
-            }});
-        }}
+            });
+        }
     </script>
 </body>
 </html>
 """
+
+
+_SECTION_RENDERERS = (
+    render_model_identification,
+    render_training_dataset,
+    render_feature_inventory,
+    render_training_configuration,
+    render_training_metrics,
+    render_model_architecture,
+    render_model_quality,
+    render_technical_details,
+    render_provenance,
+    render_column_statistics,
+)
+
+
+def _page_header(model_card_json: Dict[str, Any], generated_at: Optional[str]) -> Tuple[str, str]:
+    """Return the escaped model name and the rendered header block."""
+    model_name = _text(model_card_json.get('model_identification', {}).get('name', 'Model Card'))
+    ts = _text(generated_at) if generated_at else time.strftime('%Y-%m-%d %H:%M:%S')
+    return model_name, f"""        <div class="header">
+            <h1>Model Card: {model_name}</h1>
+            <div class="meta">
+                Generated: {ts}
+            </div>
+        </div>
+"""
+
+
+def _page_head_parts(
+    model_card_json: Dict[str, Any], inline_css: bool = True, generated_at: Optional[str] = None
+) -> List[str]:
+    """Fragments from the doctype up to and including the controls bar."""
+    model_name, header = _page_header(model_card_json, generated_at)
     
-    return html
+    return [
+        _HTML_PREFIX,
+        model_name,
+        _HTML_MID if inline_css else _HTML_MID_LINKED,
+        header,
+        _HTML_CONTROLS,
+    ]
 
 
-def render_to_file(model_card_json: Dict[str, Any], output_path: str) -> str:
-    """Render model card JSON to HTML file."""
-    html = render_html(model_card_json)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
-    return output_path
+def render_html_stream(
+    model_card_json: Dict[str, Any], buf: TextIO, inline_css: bool = True, generated_at: Optional[str] = None
+) -> None:
+    """Render complete HTML model card into a writable text stream."""
+    buf.writelines(_page_head_parts(model_card_json, inline_css, generated_at))
+    for render_section in _SECTION_RENDERERS:
+        render_section(model_card_json, buf)
+    buf.write(_HTML_SUFFIX)
+
+
+def iter_html(
+    model_card_json: Dict[str, Any], inline_css: bool = True, generated_at: Optional[str] = None
+) -> Iterator[str]:
+    """Yield the HTML model card one section at a time."""
+    yield from _page_head_parts(model_card_json, inline_css, generated_at)
+    for render_section in _SECTION_RENDERERS:
+        buf = io.StringIO()
+        render_section(model_card_json, buf)
+        yield buf.getvalue()
+    yield _HTML_SUFFIX
+
+
+RENDER_CACHE_SIZE = 64
+_RENDER_CACHE: 'OrderedDict[Hashable, str]' = OrderedDict()
+_RENDER_CACHE_LOCK = threading.Lock()
 
+
+def _render_sections(model_card_json: Dict[str, Any]) -> str:
+    """Render all card sections, without the page shell."""
+    buf = io.StringIO()
+    for render_section in _SECTION_RENDERERS:
+        render_section(model_card_json, buf)
+    return buf.getvalue()
+
+
+def _cached_sections(model_card_json: Dict[str, Any], cache_key: Optional[Hashable]) -> str:
+    """Render all card sections, reusing the LRU entry for cache_key when one is given."""
+    if cache_key is None:
+        return _render_sections(model_card_json)
+    with _RENDER_CACHE_LOCK:
+        body = _RENDER_CACHE.get(cache_key)
+        if body is not None:
+            _RENDER_CACHE.move_to_end(cache_key)
+            return body
+    body = _render_sections(model_card_json)
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE[cache_key] = body
+        if len(_RENDER_CACHE) > RENDER_CACHE_SIZE:
+            _RENDER_CACHE.popitem(last=False)
+    return body
+
+
+def render_html(
+    model_card_json: Dict[str, Any],
+    inline_css: bool = True,
+    generated_at: Optional[str] = None,
+    cache_key: Optional[Hashable] = None,
+) -> str:
+    """Render complete HTML model card.
+    
+    Passing a cache_key keeps the rendered sections in a small LRU cache, so
+    re-rendering the same card only rebuilds the header; the key must change
+    whenever the card does, as the card itself is not inspected. With
+    inline_css=False the page links CSS_FILENAME instead of embedding
+    the stylesheet; serve it alongside using get_css(). Passing generated_at
+    replaces the current time in the header, making the output reproducible.
+    """
+    parts = _page_head_parts(model_card_json, inline_css, generated_at)
+    parts.append(_cached_sections(model_card_json, cache_key))
+    parts.append(_HTML_SUFFIX)
+    return ''.join(parts)
+
+
+_HTML_PREFIX_BYTES = _HTML_PREFIX.encode('utf-8')
+_HTML_MID_BYTES = _HTML_MID.encode('utf-8')
+_HTML_MID_LINKED_BYTES = _HTML_MID_LINKED.encode('utf-8')
+_HTML_CONTROLS_BYTES = _HTML_CONTROLS.encode('utf-8')
+_HTML_SUFFIX_BYTES = _HTML_SUFFIX.encode('utf-8')
+
+
+def render_html_bytes(
+    model_card_json: Dict[str, Any],
+    inline_css: bool = True,
+    generated_at: Optional[str] = None,
+    cache_key: Optional[Hashable] = None,
+) -> bytes:
+    """Render complete HTML model card as UTF-8 bytes, e.g. for an HTTP response body.
+    
+    The static page shell is encoded once at import; only the header and
+    the section body are encoded per call. cache_key works as in render_html.
+    """
+    model_name, header = _page_header(model_card_json, generated_at)
+    return b''.join([
+        _HTML_PREFIX_BYTES,
+        model_name.encode('utf-8'),
+        _HTML_MID_BYTES if inline_css else _HTML_MID_LINKED_BYTES,
+        header.encode('utf-8'),
+        _HTML_CONTROLS_BYTES,
+        _cached_sections(model_card_json, cache_key).encode('utf-8'),
+        _HTML_SUFFIX_BYTES,
+    ])
+
+
+def get_css() -> str:
+    """Return the model card stylesheet, for serving as CSS_FILENAME."""
+    return _CSS
+
+
+def _read_text(path: str) -> Optional[str]:
+    """Return the contents of path, or None if it cannot be read."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def render_to_file(
+    model_card_json: Dict[str, Any],
+    output_path: str,
+    inline_css: bool = True,
+    generated_at: Optional[str] = None,
+) -> str:
+    """Render model card JSON to HTML file.
+    
+    With inline_css=False the stylesheet is written as CSS_FILENAME in the
+    output directory and linked from the page; an existing copy is only
+    rewritten when it differs from the current stylesheet.
+    """
+    if not inline_css:
+        css_path = os.path.join(os.path.dirname(output_path), CSS_FILENAME)
+        if _read_text(css_path) != _CSS:
+            write_text(css_path, _CSS)
+    with open_atomic(output_path) as f:
+        render_html_stream(model_card_json, f, inline_css, generated_at)
+    return output_path
@@ -4,102 +4,135 @@ Plain text renderer for Featrix Sphere Model Card JSON.
 Provides both brief and detailed versions.
 """
 
-import json
-from typing import Dict, Any, Optional
+import io
+import sys
+from typing import Dict, Any, List, Optional, TextIO, Tuple
+
+from ._io import open_atomic, write_text
+from ._json import json_pretty
+
+
+# Section keys and the N/A placeholder are shared by every renderer
+_MI_KEY = sys.intern('model_identification')
+_TD_KEY = sys.intern('training_dataset')
+_TM_KEY = sys.intern('training_metrics')
+_MQ_KEY = sys.intern('model_quality')
+_FI_KEY = sys.intern('feature_inventory')
+_NA = sys.intern('N/A')
+
+_H60 = "=" * 60
+_H80 = "=" * 80
+_SEP = _H60 + "\n"
+
+
+def _or_na(value: Any) -> Any:
+    """Show N/A for a missing or null field; 0 and False are printed as-is."""
+    return _NA if value is None else value
+
+
+def _format_list(value: list, precision: int) -> str:
+    """Format a list; flat lists of primitives don't need a JSON round-trip."""
+    if any(isinstance(v, (list, dict)) for v in value):
+        return json_pretty(value)
+    return "[" + ", ".join(map(str, value)) + "]"
 
 
 def format_value(value: Any, precision: int = 4) -> str:
     """Format a value for display."""
     if value is None:
-        return 'N/A'
+        return _NA
     if isinstance(value, float):
-        formatted = f"{value:.{precision}f}".rstrip('0').rstrip('.')
-        return formatted
-    if isinstance(value, bool):
-        return str(value)
-    if isinstance(value, (list, dict)):
-        return json.dumps(value, indent=2)
+        formatted = f"{value:.{precision}f}"
+        if '.' not in formatted:
+            # inf/nan and precision=0 have no fractional part to trim
+            return formatted
+        return formatted.rstrip('0').rstrip('.')
+    if isinstance(value, list):
+        return _format_list(value, precision)
+    if isinstance(value, dict):
+        return json_pretty(value)
+    # bool needs no check of its own: str() already gives True/False
     return str(value)
 
 
 def format_percentage(value: Optional[float]) -> str:
     """Format a percentage value."""
     if value is None:
-        return 'N/A'
+        return _NA
     return f"{value * 100:.2f}%"
 
 
+def _fmt_pct_block(items: List[Tuple[str, Optional[float]]]) -> str:
+    """Format (label, value) pairs as indented percentage lines in one join."""
+    return ''.join(
+        f"  {label}{_NA if value is None else f'{value * 100:.2f}%'}\n"
+        for label, value in items
+    )
+
+
 def render_brief_model_identification(data: Dict[str, Any]) -> str:
     """Render brief model identification."""
-    mi = data.get('model_identification', {})
+    mi = data.get(_MI_KEY, {})
     lines = [
-        f"Model: {mi.get('name', 'N/A')}",
-        f"Type: {mi.get('model_type', 'N/A')}",
-        f"Status: {mi.get('status', 'N/A')}",
-        f"Session: {mi.get('session_id', 'N/A')[:30]}...",
+        f"Model: {mi.get('name', _NA)}",
+        f"Type: {mi.get('model_type', _NA)}",
+        f"Status: {mi.get('status', _NA)}",
+        f"Session: {mi.get('session_id', _NA)[:30]}...",
     ]
     return '\n'.join(lines)
 
 
-def render_detailed_model_identification(data: Dict[str, Any]) -> str:
+def render_detailed_model_identification(data: Dict[str, Any], buf: TextIO) -> None:
     """Render detailed model identification."""
-    mi = data.get('model_identification', {})
-    lines = [
-        "=" * 60,
-        "MODEL IDENTIFICATION",
-        "=" * 60,
-        f"Session ID:     {mi.get('session_id', 'N/A')}",
-        f"Job ID:          {mi.get('job_id', 'N/A')}",
-        f"Name:            {mi.get('name', 'N/A')}",
-        f"Model Type:      {mi.get('model_type', 'N/A')}",
-        f"Status:          {mi.get('status', 'N/A')}",
-        f"Target Column:   {mi.get('target_column', 'N/A')}",
-        f"Target Type:     {mi.get('target_column_type', 'N/A')}",
-        f"Compute Cluster: {mi.get('compute_cluster', 'N/A')}",
-        f"Training Date:   {mi.get('training_date', 'N/A')}",
-        f"Framework:       {mi.get('framework', 'N/A')}",
-        "",
-    ]
-    return '\n'.join(lines)
+    mi = data.get(_MI_KEY, {})
+    buf.write(
+        _SEP + "MODEL IDENTIFICATION\n" + _SEP +
+        f"Session ID:     {_or_na(mi.get('session_id'))}\n"
+        f"Job ID:          {_or_na(mi.get('job_id'))}\n"
+        f"Name:            {_or_na(mi.get('name'))}\n"
+        f"Model Type:      {_or_na(mi.get('model_type'))}\n"
+        f"Status:          {_or_na(mi.get('status'))}\n"
+        f"Target Column:   {_or_na(mi.get('target_column'))}\n"
+        f"Target Type:     {_or_na(mi.get('target_column_type'))}\n"
+        f"Compute Cluster: {_or_na(mi.get('compute_cluster'))}\n"
+        f"Training Date:   {_or_na(mi.get('training_date'))}\n"
+        f"Framework:       {_or_na(mi.get('framework'))}\n"
+        "\n"
+    )
 
 
 def render_brief_training_dataset(data: Dict[str, Any]) -> str:
     """Render brief training dataset."""
-    td = data.get('training_dataset', {})
+    td = data.get(_TD_KEY, {})
     return f"Training: {td.get('train_rows', 0):,} rows, {td.get('total_features', 0)} features"
 
 
-def render_detailed_training_dataset(data: Dict[str, Any]) -> str:
+def render_detailed_training_dataset(data: Dict[str, Any], buf: TextIO) -> None:
     """Render detailed training dataset."""
-    td = data.get('training_dataset', {})
-    lines = [
-        "=" * 60,
-        "TRAINING DATASET",
-        "=" * 60,
-        f"Training Rows:    {td.get('train_rows', 0):,}",
-        f"Validation Rows:  {td.get('val_rows', 0):,}",
-        f"Total Rows:       {td.get('total_rows', 0):,}",
-        f"Total Features:   {td.get('total_features', 0)}",
-        f"Target Column:    {td.get('target_column', 'N/A')}",
-        "",
-        "Feature Names:",
-    ]
-    
+    td = data.get(_TD_KEY, {})
+    buf.write(
+        _SEP + "TRAINING DATASET\n" + _SEP +
+        f"Training Rows:    {td.get('train_rows', 0):,}\n"
+        f"Validation Rows:  {td.get('val_rows', 0):,}\n"
+        f"Total Rows:       {td.get('total_rows', 0):,}\n"
+        f"Total Features:   {td.get('total_features', 0)}\n"
+        f"Target Column:    {_or_na(td.get('target_column'))}\n"
+        "\n"
+        "Feature Names:\n"
+    )
+
     feature_names = td.get('feature_names', [])
-    for i, name in enumerate(feature_names, 1):
-        lines.append(f"  {i:2d}. {name}")
-    
-    lines.append("")
-    return '\n'.join(lines)
+    buf.write(''.join(f"  {i:2d}. {name}\n" for i, name in enumerate(feature_names, 1)))
+    buf.write("\n")
 
 
 def render_brief_training_metrics(data: Dict[str, Any]) -> str:
     """Render brief training metrics."""
-    tm = data.get('training_metrics', {})
-    model_type = data.get('model_identification', {}).get('model_type', '')
-    
+    tm = data.get(_TM_KEY, {})
+    model_type = data.get(_MI_KEY, {}).get('model_type', '')
+
     lines = []
-    
+
     if model_type == 'Single Predictor':
         cm = tm.get('classification_metrics')
         if cm:
@@ -110,349 +143,338 @@ def render_brief_training_metrics(data: Dict[str, Any]) -> str:
         best_epoch = tm.get('best_epoch', {})
         if best_epoch.get('val_loss') is not None:
             lines.append(f"Best Val Loss: {format_value(best_epoch.get('val_loss'))}")
-    
-    return '\n'.join(lines) if lines else "N/A"
 
+    return '\n'.join(lines) if lines else _NA
+
+
+def _render_single_predictor_metrics(tm: Dict[str, Any], buf: TextIO) -> None:
+    """Render classification, threshold and argmax metrics for a Single Predictor."""
+    fv = format_value
+    fp = format_percentage
+
+    cm = tm.get('classification_metrics')
+    if cm:
+        buf.write("Classification Metrics:\n")
+        buf.write(_fmt_pct_block([
+            ("Accuracy:  ", cm.get('accuracy')),
+            ("Precision: ", cm.get('precision')),
+            ("Recall:    ", cm.get('recall')),
+            ("F1 Score:  ", cm.get('f1')),
+            ("AUC:       ", cm.get('auc')),
+        ]))
+        buf.write(f"  Binary:    {cm.get('is_binary', False)}\n")
+        buf.write("\n")
 
-def render_detailed_training_metrics(data: Dict[str, Any]) -> str:
+    # Optimal threshold
+    opt_thresh = tm.get('optimal_threshold')
+    if opt_thresh:
+        buf.write("Optimal Threshold:\n")
+        buf.write(f"  Threshold: {fv(opt_thresh.get('optimal_threshold'))}\n")
+        buf.write(f"  Pos Label: {opt_thresh.get('pos_label', _NA)}\n")
+        buf.write(f"  F1:        {fp(opt_thresh.get('optimal_threshold_f1'))}\n")
+        buf.write(f"  Accuracy:  {fp(opt_thresh.get('accuracy_at_optimal_threshold'))}\n")
+        buf.write("\n")
+
+    # Argmax metrics
+    argmax = tm.get('argmax_metrics')
+    if argmax:
+        buf.write("Argmax Metrics:\n")
+        buf.write(_fmt_pct_block([
+            ("Accuracy:  ", argmax.get('accuracy')),
+            ("Precision: ", argmax.get('precision')),
+            ("Recall:    ", argmax.get('recall')),
+            ("F1 Score:  ", argmax.get('f1')),
+        ]))
+        buf.write("\n")
+
+
+def _render_embedding_space_metrics(tm: Dict[str, Any], buf: TextIO) -> None:
+    """Render loss progression and final epoch for an Embedding Space."""
+    fv = format_value
+
+    loss_prog = tm.get('loss_progression')
+    if loss_prog:
+        buf.write("Loss Progression:\n")
+        buf.write(f"  Initial Train Loss: {fv(loss_prog.get('initial_train'))}\n")
+        buf.write(f"  Initial Val Loss:   {fv(loss_prog.get('initial_val'))}\n")
+        buf.write(f"  Improvement %:      {fv(loss_prog.get('improvement_pct'))}\n")
+        buf.write("\n")
+
+    final_epoch = tm.get('final_epoch')
+    if final_epoch:
+        buf.write("Final Epoch:\n")
+        buf.write(f"  Epoch:      {final_epoch.get('epoch', _NA)}\n")
+        buf.write(f"  Train Loss: {fv(final_epoch.get('train_loss'))}\n")
+        buf.write(f"  Val Loss:   {fv(final_epoch.get('val_loss'))}\n")
+        buf.write("\n")
+
+
+def _render_no_model_metrics(tm: Dict[str, Any], buf: TextIO) -> None:
+    """Unknown model types have no type-specific metrics."""
+
+
+_METRIC_RENDERERS = {
+    'Single Predictor': _render_single_predictor_metrics,
+    'Embedding Space': _render_embedding_space_metrics,
+}
+
+
+def render_detailed_training_metrics(data: Dict[str, Any], buf: TextIO) -> None:
     """Render detailed training metrics."""
-    tm = data.get('training_metrics', {})
-    model_type = data.get('model_identification', {}).get('model_type', '')
-    
-    lines = [
-        "=" * 60,
-        "TRAINING METRICS",
-        "=" * 60,
-    ]
-    
+    tm = data.get(_TM_KEY, {})
+    model_type = data.get(_MI_KEY, {}).get('model_type', '')
+    fv = format_value
+
+    buf.write(_SEP)
+    buf.write("TRAINING METRICS\n")
+    buf.write(_SEP)
+
     # Best epoch
     best_epoch = tm.get('best_epoch', {})
-    lines.extend([
-        "Best Epoch:",
-        f"  Epoch:          {best_epoch.get('epoch', 'N/A')}",
-        f"  Validation Loss: {format_value(best_epoch.get('validation_loss'))}",
-        f"  Train Loss:      {format_value(best_epoch.get('train_loss'))}",
-    ])
-    
+    buf.write("Best Epoch:\n")
+    buf.write(f"  Epoch:          {best_epoch.get('epoch', _NA)}\n")
+    buf.write(f"  Validation Loss: {fv(best_epoch.get('validation_loss'))}\n")
+    buf.write(f"  Train Loss:      {fv(best_epoch.get('train_loss'))}\n")
+
     if best_epoch.get('spread_loss') is not None:
-        lines.extend([
-            f"  Spread Loss:    {format_value(best_epoch.get('spread_loss'))}",
-            f"  Joint Loss:     {format_value(best_epoch.get('joint_loss'))}",
-            f"  Marginal Loss:  {format_value(best_epoch.get('marginal_loss'))}",
-        ])
-    
-    lines.append("")
-    
-    # Classification metrics (Single Predictor)
-    if model_type == 'Single Predictor':
-        cm = tm.get('classification_metrics')
-        if cm:
-            lines.extend([
-                "Classification Metrics:",
-                f"  Accuracy:  {format_percentage(cm.get('accuracy'))}",
-                f"  Precision: {format_percentage(cm.get('precision'))}",
-                f"  Recall:    {format_percentage(cm.get('recall'))}",
-                f"  F1 Score:  {format_percentage(cm.get('f1'))}",
-                f"  AUC:       {format_percentage(cm.get('auc'))}",
-                f"  Binary:    {cm.get('is_binary', False)}",
-                "",
-            ])
-        
-        # Optimal threshold
-        opt_thresh = tm.get('optimal_threshold')
-        if opt_thresh:
-            lines.extend([
-                "Optimal Threshold:",
-                f"  Threshold: {format_value(opt_thresh.get('optimal_threshold'))}",
-                f"  Pos Label: {opt_thresh.get('pos_label', 'N/A')}",
-                f"  F1:        {format_percentage(opt_thresh.get('optimal_threshold_f1'))}",
-                f"  Accuracy:  {format_percentage(opt_thresh.get('accuracy_at_optimal_threshold'))}",
-                "",
-            ])
-        
-        # Argmax metrics
-        argmax = tm.get('argmax_metrics')
-        if argmax:
-            lines.extend([
-                "Argmax Metrics:",
-                f"  Accuracy:  {format_percentage(argmax.get('accuracy'))}",
-                f"  Precision: {format_percentage(argmax.get('precision'))}",
-                f"  Recall:    {format_percentage(argmax.get('recall'))}",
-                f"  F1 Score:  {format_percentage(argmax.get('f1'))}",
-                "",
-            ])
-    
-    # Loss progression (Embedding Space)
-    if model_type == 'Embedding Space':
-        loss_prog = tm.get('loss_progression')
-        if loss_prog:
-            lines.extend([
-                "Loss Progression:",
-                f"  Initial Train Loss: {format_value(loss_prog.get('initial_train'))}",
-                f"  Initial Val Loss:   {format_value(loss_prog.get('initial_val'))}",
-                f"  Improvement %:      {format_value(loss_prog.get('improvement_pct'))}",
-                "",
-            ])
-        
-        final_epoch = tm.get('final_epoch')
-        if final_epoch:
-            lines.extend([
-                "Final Epoch:",
-                f"  Epoch:      {final_epoch.get('epoch', 'N/A')}",
-                f"  Train Loss: {format_value(final_epoch.get('train_loss'))}",
-                f"  Val Loss:   {format_value(final_epoch.get('val_loss'))}",
-                "",
-            ])
-    
-    return '\n'.join(lines)
+        buf.write(f"  Spread Loss:    {fv(best_epoch.get('spread_loss'))}\n")
+        buf.write(f"  Joint Loss:     {fv(best_epoch.get('joint_loss'))}\n")
+        buf.write(f"  Marginal Loss:  {fv(best_epoch.get('marginal_loss'))}\n")
+
+    buf.write("\n")
+
+    _METRIC_RENDERERS.get(model_type, _render_no_model_metrics)(tm, buf)
 
 
 def render_brief_model_quality(data: Dict[str, Any]) -> str:
     """Render brief model quality."""
-    mq = data.get('model_quality', {})
+    mq = data.get(_MQ_KEY, {})
     lines = []
-    
+
     assessment = mq.get('assessment')
     if assessment:
         lines.append(f"Quality: {assessment}")
-    
+
     warnings = mq.get('warnings', [])
     if warnings:
         lines.append(f"Warnings: {len(warnings)}")
-    
-    return '\n'.join(lines) if lines else "N/A"
 
+    return '\n'.join(lines) if lines else _NA
+
+
+def _fmt_feature(feat: Dict[str, Any]) -> str:
+    """Format one feature inventory entry, including its trailing blank line."""
+    unique_vals = feat.get('unique_values')
+    text = (
+        f"Feature: {feat.get('name', _NA)}\n"
+        f"  Type:          {feat.get('type', _NA)}\n"
+        f"  Encoder:       {feat.get('encoder_type', _NA)}\n"
+        f"  Unique Values: {unique_vals if unique_vals is not None else _NA}\n"
+    )
+
+    sample_vals = feat.get('sample_values', [])
+    if sample_vals:
+        text += f"  Sample Values: {', '.join(map(str, sample_vals[:5]))}\n"
+        if len(sample_vals) > 5:
+            text += f"                 (+{len(sample_vals) - 5} more)\n"
 
-def render_detailed_model_quality(data: Dict[str, Any]) -> str:
+    stats = feat.get('statistics')
+    if stats:
+        text += (
+            "  Statistics:\n"
+            f"    Min:    {format_value(stats.get('min'))}\n"
+            f"    Max:    {format_value(stats.get('max'))}\n"
+            f"    Mean:   {format_value(stats.get('mean'))}\n"
+            f"    Std:    {format_value(stats.get('std'))}\n"
+            f"    Median: {format_value(stats.get('median'))}\n"
+        )
+    return text + "\n"
+
+
+def _fmt_warning(i: int, warning: Dict[str, Any]) -> str:
+    """Format one numbered model-quality warning, including its trailing blank line."""
+    rec = warning.get('recommendation')
+    details = warning.get('details')
+    return (
+        f"  {i}. [{warning.get('severity', 'UNKNOWN')}] {warning.get('type', _NA)}\n"
+        f"     {warning.get('message', _NA)}\n"
+        + (f"     Recommendation: {rec}\n" if rec else '')
+        + (f"     Details: {json_pretty(details, 6)}\n" if details else '')
+        + "\n"
+    )
+
+
+def render_detailed_model_quality(data: Dict[str, Any], buf: TextIO) -> None:
     """Render detailed model quality."""
-    mq = data.get('model_quality', {})
-    
-    lines = [
-        "=" * 60,
-        "MODEL QUALITY",
-        "=" * 60,
-    ]
-    
+    mq = data.get(_MQ_KEY, {})
+
+    buf.write(_SEP)
+    buf.write("MODEL QUALITY\n")
+    buf.write(_SEP)
+
     assessment = mq.get('assessment')
     if assessment:
-        lines.extend([
-            f"Assessment: {assessment}",
-            "",
-        ])
-    
+        buf.write(f"Assessment: {assessment}\n")
+        buf.write("\n")
+
     recommendations = mq.get('recommendations', [])
     if recommendations:
-        lines.append("Recommendations:")
-        for i, rec in enumerate(recommendations, 1):
-            lines.extend([
-                f"  {i}. Issue: {rec.get('issue', 'N/A')}",
-                f"     Suggestion: {rec.get('suggestion', 'N/A')}",
-                "",
-            ])
-    
+        buf.write("Recommendations:\n")
+        buf.write(''.join(
+            f"  {i}. Issue: {rec.get('issue', _NA)}\n"
+            f"     Suggestion: {rec.get('suggestion', _NA)}\n"
+            "\n"
+            for i, rec in enumerate(recommendations, 1)
+        ))
+
     warnings = mq.get('warnings', [])
     if warnings:
-        lines.append("Warnings:")
-        for i, warning in enumerate(warnings, 1):
-            lines.extend([
-                f"  {i}. [{warning.get('severity', 'UNKNOWN')}] {warning.get('type', 'N/A')}",
-                f"     {warning.get('message', 'N/A')}",
-            ])
-            if warning.get('recommendation'):
-                lines.append(f"     Recommendation: {warning.get('recommendation')}")
-            details = warning.get('details')
-            if details:
-                lines.append(f"     Details: {json.dumps(details, indent=6)}")
-            lines.append("")
-    
+        buf.write("Warnings:\n")
+        buf.write(''.join(_fmt_warning(i, warning) for i, warning in enumerate(warnings, 1)))
+
     training_quality_warning = mq.get('training_quality_warning')
     if training_quality_warning:
-        lines.extend([
-            "Training Quality Warning:",
-            f"  {training_quality_warning}",
-            "",
-        ])
-    
-    return '\n'.join(lines)
+        buf.write("Training Quality Warning:\n")
+        buf.write(f"  {training_quality_warning}\n")
+        buf.write("\n")
+
+
+_BRIEF_SECTIONS = (
+    (_MI_KEY, render_brief_model_identification),
+    (_TD_KEY, render_brief_training_dataset),
+    (_TM_KEY, render_brief_training_metrics),
+    (_MQ_KEY, render_brief_model_quality),
+)
 
 
 def render_brief_text(model_card_json: Dict[str, Any]) -> str:
-    """Render brief plain text model card."""
-    model_name = model_card_json.get('model_identification', {}).get('name', 'Model Card')
-    
-    lines = [
-        f"MODEL CARD: {model_name}",
-        "=" * 60,
-        "",
-        render_brief_model_identification(model_card_json),
-        "",
-        render_brief_training_dataset(model_card_json),
-        "",
-        render_brief_training_metrics(model_card_json),
-        "",
-        render_brief_model_quality(model_card_json),
-        "",
-    ]
-    
-    return '\n'.join(lines)
+    """Render brief plain text model card. Sections missing from the JSON are skipped."""
+    model_name = model_card_json.get(_MI_KEY, {}).get('name', 'Model Card')
 
+    parts = [f"MODEL CARD: {model_name}", _H60, ""]
+    for key, render_section in _BRIEF_SECTIONS:
+        if key in model_card_json:
+            parts.append(render_section(model_card_json))
+            parts.append("")
+
+    return '\n'.join(parts)
+
+
+def render_detailed_text_stream(model_card_json: Dict[str, Any], buf: TextIO) -> None:
+    """Render detailed plain text model card into a writable text stream."""
+    model_name = model_card_json.get(_MI_KEY, {}).get('name', 'Model Card')
+
+    buf.write(f"MODEL CARD: {model_name}\n")
+    buf.write(_H80)
+    buf.write("\n")
+    buf.write("\n")
+    render_detailed_model_identification(model_card_json, buf)
+    render_detailed_training_dataset(model_card_json, buf)
+    render_detailed_training_metrics(model_card_json, buf)
+    render_detailed_model_quality(model_card_json, buf)
 
-def render_detailed_text(model_card_json: Dict[str, Any]) -> str:
-    """Render detailed plain text model card."""
-    model_name = model_card_json.get('model_identification', {}).get('name', 'Model Card')
-    
-    lines = [
-        f"MODEL CARD: {model_name}",
-        "=" * 80,
-        "",
-        render_detailed_model_identification(model_card_json),
-        render_detailed_training_dataset(model_card_json),
-        render_detailed_training_metrics(model_card_json),
-        render_detailed_model_quality(model_card_json),
-    ]
-    
     # Add training configuration
     tc = model_card_json.get('training_configuration', {})
     if tc:
-        lines.extend([
-            "=" * 60,
-            "TRAINING CONFIGURATION",
-            "=" * 60,
-            f"Total Epochs:    {tc.get('epochs_total', 'N/A')}",
-            f"Best Epoch:      {tc.get('best_epoch', 'N/A')}",
-            f"d_model:         {tc.get('d_model', 'N/A')}",
-            f"Batch Size:      {tc.get('batch_size', 'N/A')}",
-            f"Learning Rate:  {format_value(tc.get('learning_rate'))}",
-            f"Optimizer:       {tc.get('optimizer', 'N/A')}",
-        ])
+        buf.write(
+            _SEP + "TRAINING CONFIGURATION\n" + _SEP +
+            f"Total Epochs:    {tc.get('epochs_total', _NA)}\n"
+            f"Best Epoch:      {tc.get('best_epoch', _NA)}\n"
+            f"d_model:         {tc.get('d_model', _NA)}\n"
+            f"Batch Size:      {tc.get('batch_size', _NA)}\n"
+            f"Learning Rate:  {format_value(tc.get('learning_rate'))}\n"
+            f"Optimizer:       {tc.get('optimizer', _NA)}\n"
+        )
         dropout = tc.get('dropout_schedule')
         if dropout:
-            lines.extend([
-                "",
-                "Dropout Schedule:",
-                f"  Enabled: {dropout.get('enabled', False)}",
-                f"  Initial: {format_value(dropout.get('initial'))}",
-                f"  Final:   {format_value(dropout.get('final'))}",
-            ])
-        lines.append("")
-    
+            buf.write(
+                "\n"
+                "Dropout Schedule:\n"
+                f"  Enabled: {dropout.get('enabled', False)}\n"
+                f"  Initial: {format_value(dropout.get('initial'))}\n"
+                f"  Final:   {format_value(dropout.get('final'))}\n"
+            )
+        buf.write("\n")
+
     # Add feature inventory
-    features = model_card_json.get('feature_inventory', [])
+    features = model_card_json.get(_FI_KEY, [])
     if features:
-        lines.extend([
-            "=" * 60,
-            "FEATURE INVENTORY",
-            "=" * 60,
-        ])
-        for feat in features:
-            name = feat.get('name', 'N/A')
-            feat_type = feat.get('type', 'N/A')
-            encoder = feat.get('encoder_type', 'N/A')
-            unique_vals = feat.get('unique_values')
-            sample_vals = feat.get('sample_values', [])
-            stats = feat.get('statistics')
-            
-            lines.extend([
-                f"Feature: {name}",
-                f"  Type:          {feat_type}",
-                f"  Encoder:       {encoder}",
-                f"  Unique Values: {unique_vals if unique_vals is not None else 'N/A'}",
-            ])
-            
-            if sample_vals:
-                lines.append(f"  Sample Values: {', '.join([str(v) for v in sample_vals[:5]])}")
-                if len(sample_vals) > 5:
-                    lines.append(f"                 (+{len(sample_vals) - 5} more)")
-            
-            if stats:
-                lines.extend([
-                    "  Statistics:",
-                    f"    Min:    {format_value(stats.get('min'))}",
-                    f"    Max:    {format_value(stats.get('max'))}",
-                    f"    Mean:   {format_value(stats.get('mean'))}",
-                    f"    Std:    {format_value(stats.get('std'))}",
-                    f"    Median: {format_value(stats.get('median'))}",
-                ])
-            lines.append("")
-    
+        buf.write(_SEP)
+        buf.write("FEATURE INVENTORY\n")
+        buf.write(_SEP)
+        buf.write(''.join(map(_fmt_feature, features)))
+
     # Add model architecture
     ma = model_card_json.get('model_architecture', {})
     if ma:
-        lines.extend([
-            "=" * 60,
-            "MODEL ARCHITECTURE",
-            "=" * 60,
-        ])
+        buf.write(_SEP)
+        buf.write("MODEL ARCHITECTURE\n")
+        buf.write(_SEP)
         if ma.get('predictor_layers') is not None:
-            lines.append(f"Predictor Layers: {ma.get('predictor_layers')}")
+            buf.write(f"Predictor Layers: {ma.get('predictor_layers')}\n")
         if ma.get('predictor_parameters') is not None:
-            lines.append(f"Predictor Parameters: {ma.get('predictor_parameters'):,}")
+            buf.write(f"Predictor Parameters: {ma.get('predictor_parameters'):,}\n")
         if ma.get('embedding_space_d_model') is not None:
-            lines.append(f"Embedding Space d_model: {ma.get('embedding_space_d_model')}")
-        lines.append("")
-    
+            buf.write(f"Embedding Space d_model: {ma.get('embedding_space_d_model')}\n")
+        buf.write("\n")
+
     # Add technical details
     td = model_card_json.get('technical_details', {})
     if td:
-        lines.extend([
-            "=" * 60,
-            "TECHNICAL DETAILS",
-            "=" * 60,
-            f"PyTorch Version: {td.get('pytorch_version', 'N/A')}",
-            f"Device:          {td.get('device', 'N/A')}",
-            f"Precision:       {td.get('precision', 'N/A')}",
-            f"Loss Function:   {td.get('loss_function', 'N/A')}",
-        ])
+        buf.write(
+            _SEP + "TECHNICAL DETAILS\n" + _SEP +
+            f"PyTorch Version: {td.get('pytorch_version', _NA)}\n"
+            f"Device:          {td.get('device', _NA)}\n"
+            f"Precision:       {td.get('precision', _NA)}\n"
+            f"Loss Function:   {td.get('loss_function', _NA)}\n"
+        )
         if td.get('normalization'):
-            lines.append(f"Normalization:   {td.get('normalization')}")
-        lines.append("")
-    
+            buf.write(f"Normalization:   {td.get('normalization')}\n")
+        buf.write("\n")
+
     # Add provenance
     prov = model_card_json.get('provenance', {})
     if prov:
-        lines.extend([
-            "=" * 60,
-            "PROVENANCE",
-            "=" * 60,
-            f"Created At: {prov.get('created_at', 'N/A')}",
-        ])
+        buf.write(_SEP)
+        buf.write("PROVENANCE\n")
+        buf.write(_SEP)
+        buf.write(f"Created At: {prov.get('created_at', _NA)}\n")
         if prov.get('training_duration_minutes') is not None:
             duration = prov.get('training_duration_minutes')
             hours = int(duration // 60)
             minutes = int(duration % 60)
-            lines.append(f"Training Duration: {hours}h {minutes}m ({duration:.2f} minutes)")
+            buf.write(f"Training Duration: {hours}h {minutes}m ({duration:.2f} minutes)\n")
         version_info = prov.get('version_info')
         if version_info:
-            lines.append(f"Version Info: {json.dumps(version_info, indent=2)}")
-        lines.append("")
-    
+            buf.write(f"Version Info: {json_pretty(version_info)}\n")
+        buf.write("\n")
+
     # Add column statistics (Embedding Space only)
     cs = model_card_json.get('column_statistics', {})
     if cs:
-        lines.extend([
-            "=" * 60,
-            "COLUMN STATISTICS",
-            "=" * 60,
-        ])
-        for col_name, stats in cs.items():
-            lines.extend([
-                f"Column: {col_name}",
-                f"  Mutual Information (bits): {format_value(stats.get('mutual_information_bits'))}",
-                f"  Marginal Loss:            {format_value(stats.get('marginal_loss'))}",
-                "",
-            ])
-    
-    return '\n'.join(lines)
+        buf.write(_SEP)
+        buf.write("COLUMN STATISTICS\n")
+        buf.write(_SEP)
+        buf.write(''.join([
+            f"Column: {col_name}\n"
+            f"  Mutual Information (bits): {format_value(stats.get('mutual_information_bits'))}\n"
+            f"  Marginal Loss:            {format_value(stats.get('marginal_loss'))}\n"
+            "\n"
+            for col_name, stats in cs.items()
+        ]))
+
+
+def render_detailed_text(model_card_json: Dict[str, Any]) -> str:
+    """Render detailed plain text model card."""
+    buf = io.StringIO()
+    render_detailed_text_stream(model_card_json, buf)
+    return buf.getvalue()
 
 
 def render_to_file(model_card_json: Dict[str, Any], output_path: str, detailed: bool = True) -> str:
     """Render model card JSON to text file."""
-    if detailed:
-        text = render_detailed_text(model_card_json)
-    else:
-        text = render_brief_text(model_card_json)
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(text)
+    if not detailed:
+        return write_text(output_path, render_brief_text(model_card_json))
+    with open_atomic(output_path) as f:
+        render_detailed_text_stream(model_card_json, f)
     return output_path
-
@@ -0,0 +1,132 @@
+"""
+Regression tests for the HTML renderer.
+"""
+
+import os
+import tempfile
+import unittest
+
+from example_usage import example_model_card
+from renderers import CSS_FILENAME, get_css, render_html, render_html_bytes
+from renderers.html_renderer import render_to_file
+from renderers.html_renderer import _RENDER_CACHE
+
+
+def _card(validation_loss):
+    return {
+        'model_identification': {'name': 'cache-test'},
+        'training_metrics': {'best_epoch': {'epoch': 1, 'validation_loss': validation_loss}},
+    }
+
+
+_SCRIPT = '<script>alert(1)</script>'
+_ESCAPED_SCRIPT = '&lt;script&gt;alert(1)&lt;/script&gt;'
+
+
+def _hostile_card():
+    return {
+        'model_identification': {'name': _SCRIPT},
+        'training_dataset': {'total_features': _SCRIPT, 'feature_names': [_SCRIPT]},
+        'feature_inventory': [{'name': _SCRIPT, 'sample_values': [_SCRIPT]}],
+        'model_quality': {'warnings': [{'severity': 'HIGH', 'message': _SCRIPT}]},
+    }
+
+
+class EscapingTest(unittest.TestCase):
+
+    def test_user_values_are_escaped(self):
+        html = render_html(_hostile_card(), generated_at='t')
+        self.assertNotIn(_SCRIPT, html)
+        # title, header, model name, total features, feature tag, inventory name,
+        # sample value and warning message
+        self.assertEqual(html.count(_ESCAPED_SCRIPT), 8)
+
+    def test_na_markup_is_not_escaped(self):
+        html = render_html(_hostile_card(), generated_at='t')
+        self.assertIn('<em>N/A</em>', html)
+        self.assertNotIn('&lt;em&gt;', html)
+
+
+class GeneratedAtTest(unittest.TestCase):
+
+    def test_fixed_timestamp_makes_output_reproducible(self):
+        first = render_html(_hostile_card(), generated_at='2024-01-02 03:04:05')
+        self.assertIn('Generated: 2024-01-02 03:04:05', first)
+        self.assertEqual(first, render_html(_hostile_card(), generated_at='2024-01-02 03:04:05'))
+
+    def test_timestamp_is_escaped(self):
+        self.assertIn(_ESCAPED_SCRIPT, render_html({}, generated_at=_SCRIPT))
+
+
+class RenderBytesTest(unittest.TestCase):
+
+    def test_bytes_match_encoded_text(self):
+        cards = [{}, _card(None), _hostile_card(), example_model_card,
+                 {'model_identification': {'name': 'modèle ✓'}}]
+        for card in cards:
+            for inline_css in (True, False):
+                with self.subTest(card=card, inline_css=inline_css):
+                    self.assertEqual(
+                        render_html_bytes(card, inline_css, generated_at='t'),
+                        render_html(card, inline_css, generated_at='t').encode('utf-8'),
+                    )
+
+
+class LinkedCssTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.html_path = os.path.join(self._tmpdir.name, 'card.html')
+        self.css_path = os.path.join(self._tmpdir.name, CSS_FILENAME)
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def _read_css(self):
+        with open(self.css_path, encoding='utf-8') as f:
+            return f.read()
+
+    def test_stylesheet_is_written_and_linked(self):
+        render_to_file({}, self.html_path, inline_css=False, generated_at='t')
+        self.assertEqual(self._read_css(), get_css())
+        with open(self.html_path, encoding='utf-8') as f:
+            self.assertIn(f'href="{CSS_FILENAME}"', f.read())
+
+    def test_stale_stylesheet_is_rewritten(self):
+        with open(self.css_path, 'w', encoding='utf-8') as f:
+            f.write('body { color: red; }')
+        render_to_file({}, self.html_path, inline_css=False, generated_at='t')
+        self.assertEqual(self._read_css(), get_css())
+
+    def test_current_stylesheet_is_left_alone(self):
+        render_to_file({}, self.html_path, inline_css=False, generated_at='t')
+        mtime = os.stat(self.css_path).st_mtime_ns
+        os.utime(self.css_path, ns=(mtime - 10**9, mtime - 10**9))
+        render_to_file({}, self.html_path, inline_css=False, generated_at='t')
+        self.assertEqual(os.stat(self.css_path).st_mtime_ns, mtime - 10**9)
+
+
+class RenderCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        _RENDER_CACHE.clear()
+
+    def test_nan_and_none_do_not_share_cached_output(self):
+        nan_html = render_html(_card(float('nan')), generated_at='t')
+        none_html = render_html(_card(None), generated_at='t')
+        self.assertIn('<td>nan</td>', nan_html)
+        self.assertNotIn('<td>nan</td>', none_html)
+        self.assertIn('<em>N/A</em>', none_html)
+        self.assertEqual(none_html.encode('utf-8'), render_html_bytes(_card(None), generated_at='t'))
+
+    def test_cards_are_only_cached_under_a_caller_key(self):
+        render_html(_card(0.5), generated_at='t')
+        self.assertEqual(len(_RENDER_CACHE), 0)
+        first = render_html(_card(0.5), generated_at='t', cache_key='card-1')
+        self.assertEqual(first, render_html(_card(0.75), generated_at='t', cache_key='card-1'))
+        self.assertNotEqual(first, render_html(_card(0.75), generated_at='t', cache_key='card-2'))
+        self.assertEqual(first.encode('utf-8'), render_html_bytes(_card(0.75), generated_at='t', cache_key='card-1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
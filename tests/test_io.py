@@ -0,0 +1,49 @@
+"""
+Regression tests for the atomic file output helpers.
+"""
+
+import os
+import stat
+import tempfile
+import unittest
+
+from renderers._io import open_atomic, write_text
+
+
+class OpenAtomicTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.dir = self._tmpdir.name
+        self.path = os.path.join(self.dir, 'card.html')
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_write_replaces_file_and_leaves_no_temp_files(self):
+        write_text(self.path, 'old')
+        self.assertEqual(write_text(self.path, 'new'), self.path)
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'new')
+        self.assertEqual(os.listdir(self.dir), ['card.html'])
+
+    def test_error_keeps_target_and_removes_temp_file(self):
+        write_text(self.path, 'old')
+        with self.assertRaises(RuntimeError):
+            with open_atomic(self.path) as f:
+                f.write('partial')
+                raise RuntimeError('render failed')
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'old')
+        self.assertEqual(os.listdir(self.dir), ['card.html'])
+
+    def test_mode_matches_plain_open(self):
+        plain = os.path.join(self.dir, 'plain.html')
+        with open(plain, 'w', encoding='utf-8') as f:
+            f.write('x')
+        write_text(self.path, 'x')
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), stat.S_IMODE(os.stat(plain).st_mode))
+
+
+if __name__ == '__main__':
+    unittest.main()